@@ -3,7 +3,7 @@ import numpy as np
 import torch
 
 from mmdet.cv_core.runner import (HOOKS, EpochBasedRunner, OptimizerHook, build_optimizer)
-from mmdet.cv_core import build_from_cfg, MMDataParallel
+from mmdet.cv_core import build_from_cfg, MMDataParallel, is_module_wrapper
 from mmdet.det_core import EvalHook
 from mmdet.datasets import build_dataloader, build_dataset
 from mmdet.utils import get_root_logger
@@ -48,8 +48,14 @@ def train_detector(model,
     ]
 
     # 作用很大，不仅仅是做dataparallel，还包括对DataContainer数据解码
-    model = MMDataParallel(
-        model.cuda(cfg.gpu_ids[0]), device_ids=cfg.gpu_ids)
+    if is_module_wrapper(model):
+        # wrapping it again would scatter (or all-reduce) everything twice
+        logger.warning(f'The model is already wrapped by '
+                       f'{model.__class__.__name__}, skip wrapping it by '
+                       'MMDataParallel')
+    else:
+        model = MMDataParallel(
+            model.cuda(cfg.gpu_ids[0]), device_ids=cfg.gpu_ids)
 
     # build runner
     optimizer = build_optimizer(model, cfg.optimizer)
@@ -2,7 +2,8 @@
 from .base_runner import BaseRunner
 from .builder import RUNNERS, build_runner
 from .checkpoint import (_load_checkpoint, load_checkpoint, load_state_dict,
-                         save_checkpoint, weights_to_cpu)
+                         save_checkpoint, weights_to_buffers, weights_to_cpu)
+from .dist_utils import get_dist_info
 from .epoch_based_runner import EpochBasedRunner, Runner
 from .hooks import (HOOKS, CheckpointHook, Hook, IterTimerHook,
                     LoggerHook, LrUpdaterHook, OptimizerHook, TextLoggerHook)
@@ -18,9 +19,10 @@ __all__ = [
     'BaseRunner', 'Runner', 'EpochBasedRunner', 'IterBasedRunner', 'LogBuffer',
     'HOOKS', 'Hook', 'CheckpointHook', 'LrUpdaterHook',
     'OptimizerHook', 'IterTimerHook', 'LoggerHook', 'TextLoggerHook', '_load_checkpoint',
-    'load_state_dict', 'load_checkpoint', 'weights_to_cpu', 'save_checkpoint',
+    'load_state_dict', 'load_checkpoint', 'weights_to_cpu', 'weights_to_buffers',
+    'save_checkpoint',
     'Priority', 'get_priority', 'get_host_info', 'get_time_str',
     'obj_from_dict', 'OPTIMIZER_BUILDERS', 'OPTIMIZERS', 'DefaultOptimizerConstructor',
     'build_optimizer', 'build_optimizer_constructor', 'IterLoader',
-    'set_random_seed', 'RUNNERS', 'build_runner'
+    'set_random_seed', 'RUNNERS', 'build_runner', 'get_dist_info'
 ]
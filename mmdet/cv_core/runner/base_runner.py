@@ -1,19 +1,31 @@
 # Copyright (c) Open-MMLab. All rights reserved.
+import bisect
+import contextlib
+import functools
 import logging
 import os.path as osp
+import platform
+import shutil
 import warnings
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import Optimizer
 
 from mmdet import cv_core
-from .checkpoint import load_checkpoint
+from ..parallel import is_module_wrapper
+from .checkpoint import load_checkpoint, save_checkpoint
+from .dist_utils import get_dist_info
 from .hooks import HOOKS, Hook, IterTimerHook
 from .log_buffer import LogBuffer
 from .priority import get_priority
 from .utils import get_time_str
 
+# set of ``Hook.stages`` for fast membership tests in ``call_hook()``
+_HOOK_STAGES = frozenset(Hook.stages)
+
 
 class BaseRunner(metaclass=ABCMeta):
     """The base class of Runner, a training helper for PyTorch.
@@ -106,14 +118,23 @@ class BaseRunner(metaclass=ABCMeta):
             raise TypeError('"work_dir" must be a str or None')
 
         # get model name from the model class
-        if hasattr(self.model, 'module'):
-            self._model_name = self.model.module.__class__.__name__
+        if is_module_wrapper(self.model):
+            self._raw_model = self.model.module
         else:
-            self._model_name = self.model.__class__.__name__
+            self._raw_model = self.model
+        self._model_name = self._raw_model.__class__.__name__
 
+        self._rank, self._world_size = get_dist_info()
         self.timestamp = get_time_str()
         self.mode = None
         self._hooks = []
+        # priorities of ``self._hooks``, kept in the same (sorted) order
+        self._hook_priorities = []
+        # bound hook methods (and their priorities) of each triggered stage,
+        # so that ``call_hook()`` does not need to look them up every time
+        self._hook_fns = {}
+        self._hook_fn_priorities = {}
+        self._hooks_frozen = False
         self._epoch = 0
         self._iter = 0
         self._inner_iter = 0
@@ -122,6 +143,11 @@ class BaseRunner(metaclass=ABCMeta):
                 'Only one of `max_epochs` or `max_iters` can be set.')
         self._max_epochs = max_epochs
         self._max_iters = max_iters
+        # checkpoint writers for ``save_checkpoint(..., async_save=True)``
+        self._ckpt_executor = None
+        self._ckpt_future = None
+        # cpu (pinned) copies of the model weights reused by async saving
+        self._ckpt_buffers = {}
         # TODO: Redesign LogBuffer, it is not flexible and elegant enough
         self.log_buffer = LogBuffer()
 
@@ -130,6 +156,23 @@ class BaseRunner(metaclass=ABCMeta):
         """str: Name of the model, usually the module class name."""
         return self._model_name
 
+    @property
+    def raw_model(self):
+        """:obj:`torch.nn.Module`: The model without module wrappers such as
+        :obj:`MMDataParallel` and :obj:`DistributedDataParallel`."""
+        return self._raw_model
+
+    @property
+    def rank(self):
+        """int: Rank of current process. (distributed training)"""
+        return self._rank
+
+    @property
+    def world_size(self):
+        """int: Number of processes participating in the job.
+        (distributed training)"""
+        return self._world_size
+
     @property
     def hooks(self):
         """list[:obj:`Hook`]: A list of registered hooks."""
@@ -178,9 +221,97 @@ class BaseRunner(metaclass=ABCMeta):
                         filename_tmpl,
                         save_optimizer=True,
                         meta=None,
-                        create_symlink=True):
+                        create_symlink=True,
+                        async_save=False):
         pass
 
+    def _save_checkpoint(self,
+                         filepath,
+                         optimizer=None,
+                         meta=None,
+                         create_symlink=True,
+                         async_save=False):
+        """Save the model (and optimizer) states to ``filepath``.
+
+        If ``async_save`` is True, the states are copied to cpu and the file
+        is written by a background thread. Only one checkpoint is written at a
+        time, the previous one is always finished before saving a new one, so
+        the staging buffers of the model weights can be reused. "latest.pth"
+        is only updated once the file is completely written.
+        """
+        self.wait_for_checkpoint()
+        if async_save:
+            if self._ckpt_executor is None:
+                self._ckpt_executor = ThreadPoolExecutor(max_workers=1)
+            self._ckpt_future = save_checkpoint(
+                self.model,
+                filepath,
+                optimizer=optimizer,
+                meta=meta,
+                executor=self._ckpt_executor,
+                buffers=self._ckpt_buffers)
+        else:
+            save_checkpoint(
+                self.model, filepath, optimizer=optimizer, meta=meta)
+        if create_symlink:
+            self.call_after_checkpoint(
+                functools.partial(self._link_latest_checkpoint, filepath))
+
+    def call_after_checkpoint(self, fn):
+        """Call ``fn`` once the checkpoint being saved is completely written.
+
+        ``fn`` is called at once if no checkpoint is written in background.
+        Otherwise the writer thread calls it after the writing succeeds, so
+        that e.g. "latest.pth" is not linked to a broken file and the old
+        checkpoints are not removed before the new one exists. If the writing
+        fails, ``fn`` is not called and the error is re-raised by
+        :meth:`wait_for_checkpoint`.
+
+        Args:
+            fn (callable): The function to call without arguments.
+        """
+        if self._ckpt_future is None:
+            fn()
+            return
+
+        def _call_after_write(write_future=self._ckpt_future):
+            write_future.result()
+            fn()
+
+        self._ckpt_future = self._ckpt_executor.submit(_call_after_write)
+
+    @staticmethod
+    def _link_latest_checkpoint(filepath):
+        """Make "latest.pth" next to ``filepath`` point to it."""
+        out_dir, filename = osp.split(filepath)
+        dst_file = osp.join(out_dir, 'latest.pth')
+        # in some environments, `os.symlink` is not supported, you may need to
+        # set `create_symlink` to False
+        if platform.system() != 'Windows':
+            cv_core.symlink(filename, dst_file)
+        else:
+            shutil.copy(filepath, dst_file)
+
+    def wait_for_checkpoint(self, shutdown=False):
+        """Wait until the checkpoint written in background is saved.
+
+        Errors raised during the writing are re-raised here.
+
+        Args:
+            shutdown (bool): Whether to also stop the background writer
+                thread. It is started again by the next async saving.
+                Default: False.
+        """
+        future = self._ckpt_future
+        self._ckpt_future = None
+        try:
+            if future is not None:
+                future.result()
+        finally:
+            if shutdown and self._ckpt_executor is not None:
+                self._ckpt_executor.shutdown(wait=True)
+                self._ckpt_executor = None
+
     def current_lr(self):
         """Get current learning rates.
 
@@ -231,13 +362,39 @@ class BaseRunner(metaclass=ABCMeta):
                 momentums[name] = _get_momentum(optim)
         return momentums
 
+    def ddp_no_sync_ctx(self, is_last_microstep):
+        """Get a context that skips gradient synchronization of DDP.
+
+        When gradients are accumulated over several micro-steps, only the last
+        one needs the AllReduce. Train loops should wrap both the forward
+        (``model(...)``/``model.train_step(...)``) and ``loss.backward()`` of
+        the micro-steps ``0..accum_steps-2`` in this context, otherwise the
+        forward still prepares DDP for a synchronized backward.
+
+        Args:
+            is_last_microstep (bool): Whether it is the last micro-step of
+                the accumulation, whose gradients have to be synchronized.
+
+        Returns:
+            contextmanager: ``model.no_sync()`` if the model is a
+                :obj:`DistributedDataParallel` and it is not the last
+                micro-step, otherwise a context that does nothing.
+        """
+        if isinstance(self.model,
+                      DistributedDataParallel) and not is_last_microstep:
+            return self.model.no_sync()
+        # ``contextlib.nullcontext`` is not available in Python 3.6, an empty
+        # ``suppress()`` does nothing as well
+        return contextlib.suppress()
+
     def register_hook(self, hook, priority='NORMAL'):
         """Register a hook into the hook list.
 
         The hook will be inserted into a priority queue, with the specified
         priority (See :class:`Priority` for details of priorities).
         For hooks with the same priority, they will be triggered in the same
-        order as they are registered.
+        order as they are registered. Hooks with ``main_only=True`` are only
+        registered in the main process.
 
         Args:
             hook (:obj:`Hook`): The hook to be registered.
@@ -248,16 +405,39 @@ class BaseRunner(metaclass=ABCMeta):
         if hasattr(hook, 'priority'):
             raise ValueError('"priority" is a reserved attribute for hooks')
         priority = get_priority(priority)
+        if hook.main_only and self.rank != 0:
+            return
         hook.priority = priority
-        # insert the hook to a sorted list
-        inserted = False
-        for i in range(len(self._hooks) - 1, -1, -1):
-            if priority >= self._hooks[i].priority:
-                self._hooks.insert(i + 1, hook)
-                inserted = True
-                break
-        if not inserted:
-            self._hooks.insert(0, hook)
+        # insert the hook to a sorted list, bisect_right keeps the
+        # registration order for hooks with the same priority
+        idx = bisect.bisect_right(self._hook_priorities, priority)
+        self._hooks.insert(idx, hook)
+        self._hook_priorities.insert(idx, priority)
+        if self._hooks_frozen:
+            self._hook_fns = {
+                stage: list(fns)
+                for stage, fns in self._hook_fns.items()
+            }
+            self._hooks_frozen = False
+        for stage in hook.get_triggered_stages():
+            fns = self._hook_fns.setdefault(stage, [])
+            fn_priorities = self._hook_fn_priorities.setdefault(stage, [])
+            idx = bisect.bisect_right(fn_priorities, priority)
+            fns.insert(idx, getattr(hook, stage))
+            fn_priorities.insert(idx, priority)
+
+    def freeze_hooks(self):
+        """Freeze the hook methods of each stage into tuples.
+
+        This is called at the beginning of ``run()`` to make the dispatch of
+        ``call_hook()`` a bit cheaper. Registering a new hook afterwards still
+        works, it unfreezes the hooks.
+        """
+        self._hook_fns = {
+            stage: tuple(fns)
+            for stage, fns in self._hook_fns.items()
+        }
+        self._hooks_frozen = True
 
     def register_hook_from_cfg(self, hook_cfg):
         """Register a hook from its cfg.
@@ -282,10 +462,17 @@ class BaseRunner(metaclass=ABCMeta):
             fn_name (str): The function name in each hook to be called, such as
                 "before_train_epoch".
         """
-        for hook in self._hooks:
-            getattr(hook, fn_name)(self)
+        if fn_name in _HOOK_STAGES:
+            # hooks that do nothing in this stage are skipped
+            for fn in self._hook_fns.get(fn_name, ()):
+                fn(self)
+        else:
+            for hook in self._hooks:
+                getattr(hook, fn_name)(self)
 
     def load_checkpoint(self, filename, map_location='cpu', strict=False):
+        # the checkpoint to load may still be being written
+        self.wait_for_checkpoint()
         self.logger.info('load checkpoint from %s', filename)
         return load_checkpoint(self.model, filename, map_location, strict,
                                self.logger)
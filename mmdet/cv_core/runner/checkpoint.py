@@ -1,11 +1,11 @@
 # Copyright (c) Open-MMLab. All rights reserved.
+import functools
 import os.path as osp
 import pkgutil
 import warnings
 from collections import OrderedDict
 from importlib import import_module
 import torch
-import torchvision
 from torch.optim import Optimizer
 from torch.utils import model_zoo
 
@@ -86,7 +86,12 @@ def load_url_dist(url, model_dir=None):
     return checkpoint
 
 
+@functools.lru_cache(maxsize=None)
 def get_torchvision_models():
+    # torchvision is imported here since it is only needed by
+    # ``torchvision://`` checkpoints and it is slow to import
+    import torchvision
+
     model_urls = dict()
     for _, name, ispkg in pkgutil.walk_packages(torchvision.models.__path__):
         if ispkg:
@@ -206,6 +211,41 @@ def weights_to_cpu(state_dict):
     return state_dict_cpu
 
 
+def weights_to_buffers(state_dict, buffers):
+    """Copy a model state_dict into reusable cpu buffers.
+
+    A buffer is (re)allocated only if it is missing from ``buffers`` or its
+    shape or dtype changed, so repeated calls do not allocate host memory.
+    Buffers of cuda tensors are pinned, which makes the copies asynchronous.
+
+    Args:
+        state_dict (OrderedDict): Model weights on GPU.
+        buffers (dict): Cpu tensors from the last call, updated in place.
+
+    Returns:
+        OrderedDict: Model weights in ``buffers``.
+    """
+    state_dict_cpu = OrderedDict()
+    devices = set()
+    for key, val in state_dict.items():
+        if not isinstance(val, torch.Tensor):
+            state_dict_cpu[key] = val
+            continue
+        buf = buffers.get(key)
+        if buf is None or buf.shape != val.shape or buf.dtype != val.dtype:
+            buf = torch.empty(
+                val.shape, dtype=val.dtype, pin_memory=val.is_cuda)
+            buffers[key] = buf
+        buf.copy_(val, non_blocking=val.is_cuda)
+        if val.is_cuda:
+            devices.add(val.device)
+        state_dict_cpu[key] = buf
+    # wait for the non-blocking copies
+    for device in devices:
+        torch.cuda.synchronize(device)
+    return state_dict_cpu
+
+
 def _save_to_state_dict(module, destination, prefix, keep_vars):
     """Saves module state to `destination` dictionary.
 
@@ -265,7 +305,35 @@ def get_state_dict(module, destination=None, prefix='', keep_vars=False):
     return destination
 
 
-def save_checkpoint(model, filename, optimizer=None, meta=None):
+def _states_to_cpu(states):
+    """Recursively copy all the tensors in ``states`` to cpu.
+
+    Unlike :func:`weights_to_cpu`, tensors already on cpu are copied too, so
+    the result is not affected by the in-place updates of later iterations.
+    """
+    if isinstance(states, torch.Tensor):
+        return states.detach().to('cpu', copy=True)
+    elif isinstance(states, dict):
+        return type(states)(
+            (key, _states_to_cpu(val)) for key, val in states.items())
+    elif isinstance(states, (list, tuple)):
+        return type(states)(_states_to_cpu(val) for val in states)
+    return states
+
+
+def _write_checkpoint(checkpoint, filename):
+    # immediately flush buffer
+    with open(filename, 'wb') as f:
+        torch.save(checkpoint, f)
+        f.flush()
+
+
+def save_checkpoint(model,
+                    filename,
+                    optimizer=None,
+                    meta=None,
+                    executor=None,
+                    buffers=None):
     """Save checkpoint to file.
 
     The checkpoint will have 3 fields: ``meta``, ``state_dict`` and
@@ -276,6 +344,17 @@ def save_checkpoint(model, filename, optimizer=None, meta=None):
         filename (str): Checkpoint filename.
         optimizer (:obj:`Optimizer`, optional): Optimizer to be saved.
         meta (dict, optional): Metadata to be saved in checkpoint.
+        executor (:obj:`concurrent.futures.Executor`, optional): If given,
+            the states are copied to cpu at once and the checkpoint is
+            written to disk in the executor, so that training can continue
+            during the writing. Default: None.
+        buffers (dict, optional): Reusable cpu tensors to copy the model
+            weights into, see :func:`weights_to_buffers`. They must not be
+            modified until the writing finishes. Default: None.
+
+    Returns:
+        :obj:`concurrent.futures.Future` | None: The future of the writing
+            if ``executor`` is given, otherwise None.
     """
     if meta is None:
         meta = {}
@@ -284,10 +363,13 @@ def save_checkpoint(model, filename, optimizer=None, meta=None):
 
     cv_core.mkdir_or_exist(osp.dirname(filename))
 
-    checkpoint = {
-        'meta': meta,
-        'state_dict': weights_to_cpu(get_state_dict(model))
-    }
+    if buffers is not None:
+        state_dict = weights_to_buffers(get_state_dict(model), buffers)
+    elif executor is not None:
+        state_dict = _states_to_cpu(get_state_dict(model))
+    else:
+        state_dict = weights_to_cpu(get_state_dict(model))
+    checkpoint = {'meta': meta, 'state_dict': state_dict}
     # save optimizer state dict in the checkpoint
     if isinstance(optimizer, Optimizer):
         checkpoint['optimizer'] = optimizer.state_dict()
@@ -295,7 +377,11 @@ def save_checkpoint(model, filename, optimizer=None, meta=None):
         checkpoint['optimizer'] = {}
         for name, optim in optimizer.items():
             checkpoint['optimizer'][name] = optim.state_dict()
-    # immediately flush buffer
-    with open(filename, 'wb') as f:
-        torch.save(checkpoint, f)
-        f.flush()
+
+    if executor is not None:
+        # the optimizer states are updated in place by the following steps,
+        # so they are copied before being written in the background
+        if 'optimizer' in checkpoint:
+            checkpoint['optimizer'] = _states_to_cpu(checkpoint['optimizer'])
+        return executor.submit(_write_checkpoint, checkpoint, filename)
+    _write_checkpoint(checkpoint, filename)
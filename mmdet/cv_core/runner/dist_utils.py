@@ -0,0 +1,23 @@
+# Copyright (c) Open-MMLab. All rights reserved.
+import torch.distributed as dist
+
+_dist_info = None
+
+
+def get_dist_info():
+    """Get the rank and world size of the current process.
+
+    The result is cached once the default process group is initialized,
+    since neither of them can change afterwards. Before that (and in
+    non-distributed runs) ``(0, 1)`` is returned.
+
+    Returns:
+        tuple[int]: The rank and the world size.
+    """
+    global _dist_info
+    if _dist_info is not None:
+        return _dist_info
+    if dist.is_available() and dist.is_initialized():
+        _dist_info = (dist.get_rank(), dist.get_world_size())
+        return _dist_info
+    return 0, 1
@@ -1,7 +1,5 @@
 # Copyright (c) Open-MMLab. All rights reserved.
 import os.path as osp
-import platform
-import shutil
 import time
 import warnings
 
@@ -9,7 +7,6 @@ import torch
 from mmdet import cv_core
 from .builder import RUNNERS
 from .base_runner import BaseRunner
-from .checkpoint import save_checkpoint
 from .utils import get_host_info
 
 @RUNNERS.register_module()
@@ -102,6 +99,7 @@ class EpochBasedRunner(BaseRunner):
                          get_host_info(), work_dir)
         self.logger.info('workflow: %s, max: %d epochs', workflow,
                          self._max_epochs)
+        self.freeze_hooks()
         self.call_hook('before_run')
 
         while self.epoch < self._max_epochs:
@@ -124,6 +122,7 @@ class EpochBasedRunner(BaseRunner):
                     epoch_runner(data_loaders[i], **kwargs)
 
         time.sleep(1)  # wait for some hooks like loggers to finish
+        self.wait_for_checkpoint(shutdown=True)
         self.call_hook('after_run')
 
     def save_checkpoint(self,
@@ -131,7 +130,8 @@ class EpochBasedRunner(BaseRunner):
                         filename_tmpl='epoch_{}.pth',
                         save_optimizer=True,
                         meta=None,
-                        create_symlink=True):
+                        create_symlink=True,
+                        async_save=False):
         """Save the checkpoint.
 
         Args:
@@ -146,6 +146,8 @@ class EpochBasedRunner(BaseRunner):
             create_symlink (bool, optional): Whether to create a symlink
                 "latest.pth" to point to the latest checkpoint.
                 Defaults to True.
+            async_save (bool, optional): Whether to write the checkpoint file
+                in a background thread. Defaults to False.
         """
         if meta is None:
             meta = dict(epoch=self.epoch + 1, iter=self.iter)
@@ -160,15 +162,12 @@ class EpochBasedRunner(BaseRunner):
         filename = filename_tmpl.format(self.epoch + 1)
         filepath = osp.join(out_dir, filename)
         optimizer = self.optimizer if save_optimizer else None
-        save_checkpoint(self.model, filepath, optimizer=optimizer, meta=meta)
-        # in some environments, `os.symlink` is not supported, you may need to
-        # set `create_symlink` to False
-        if create_symlink:
-            dst_file = osp.join(out_dir, 'latest.pth')
-            if platform.system() != 'Windows':
-                cv_core.symlink(filename, dst_file)
-            else:
-                shutil.copy(filename, dst_file)
+        self._save_checkpoint(
+            filepath,
+            optimizer=optimizer,
+            meta=meta,
+            create_symlink=create_symlink,
+            async_save=async_save)
 
 @RUNNERS.register_module()
 class Runner(EpochBasedRunner):
@@ -1,4 +1,5 @@
 # Copyright (c) Open-MMLab. All rights reserved.
+import functools
 import os
 
 from .hook import HOOKS, Hook
@@ -23,20 +24,28 @@ class CheckpointHook(Hook):
             In some cases we want only the latest few checkpoints and would
             like to delete old ones to save the disk space.
             Default: -1, which means unlimited.
+        async_save (bool): Whether to write the checkpoint files in a
+            background thread. The states are still copied to cpu in the
+            training thread, but training does not wait for the disk.
+            Default: False.
     """
 
+    main_only = True
+
     def __init__(self,
                  interval=-1,
                  by_epoch=True,
                  save_optimizer=True,
                  out_dir=None,
                  max_keep_ckpts=-1,
+                 async_save=False,
                  **kwargs):
         self.interval = interval
         self.by_epoch = by_epoch
         self.save_optimizer = save_optimizer
         self.out_dir = out_dir
         self.max_keep_ckpts = max_keep_ckpts
+        self.async_save = async_save
         self.args = kwargs
 
 
@@ -48,19 +57,17 @@ class CheckpointHook(Hook):
         if not self.out_dir:
             self.out_dir = runner.work_dir
         runner.save_checkpoint(
-            self.out_dir, save_optimizer=self.save_optimizer, **self.args)
+            self.out_dir,
+            save_optimizer=self.save_optimizer,
+            async_save=self.async_save,
+            **self.args)
 
         # remove other checkpoints
         if self.max_keep_ckpts > 0:
             filename_tmpl = self.args.get('filename_tmpl', 'epoch_{}.pth')
-            current_epoch = runner.epoch + 1
-            for epoch in range(current_epoch - self.max_keep_ckpts, 0, -1):
-                ckpt_path = os.path.join(self.out_dir,
-                                         filename_tmpl.format(epoch))
-                if os.path.exists(ckpt_path):
-                    os.remove(ckpt_path)
-                else:
-                    break
+            runner.call_after_checkpoint(
+                functools.partial(self._remove_old_checkpoints,
+                                  filename_tmpl, runner.epoch + 1, 1))
 
 
     def after_train_iter(self, runner):
@@ -72,18 +79,29 @@ class CheckpointHook(Hook):
         if not self.out_dir:
             self.out_dir = runner.work_dir
         runner.save_checkpoint(
-            self.out_dir, save_optimizer=self.save_optimizer, **self.args)
+            self.out_dir,
+            save_optimizer=self.save_optimizer,
+            async_save=self.async_save,
+            **self.args)
 
         # remove other checkpoints
         if self.max_keep_ckpts > 0:
             filename_tmpl = self.args.get('filename_tmpl', 'iter_{}.pth')
-            current_iter = runner.iter + 1
-            for _iter in range(
-                    current_iter - self.max_keep_ckpts * self.interval, 0,
-                    -self.interval):
-                ckpt_path = os.path.join(self.out_dir,
-                                         filename_tmpl.format(_iter))
-                if os.path.exists(ckpt_path):
-                    os.remove(ckpt_path)
-                else:
-                    break
+            runner.call_after_checkpoint(
+                functools.partial(self._remove_old_checkpoints,
+                                  filename_tmpl, runner.iter + 1,
+                                  self.interval))
+
+    def _remove_old_checkpoints(self, filename_tmpl, current, step):
+        """Remove the checkpoints older than the ``max_keep_ckpts`` latest.
+
+        It is called through ``runner.call_after_checkpoint()``, so with
+        ``async_save=True`` nothing is removed until the checkpoint of
+        ``current`` is completely written.
+        """
+        for idx in range(current - self.max_keep_ckpts * step, 0, -step):
+            ckpt_path = os.path.join(self.out_dir, filename_tmpl.format(idx))
+            if os.path.exists(ckpt_path):
+                os.remove(ckpt_path)
+            else:
+                break
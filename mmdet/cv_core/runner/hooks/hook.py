@@ -1,11 +1,21 @@
 # Copyright (c) Open-MMLab. All rights reserved.
-from mmdet.cv_core.utils import Registry
+from mmdet.cv_core.utils import Registry, is_method_overridden
 
 HOOKS = Registry('hook')
 
 
 class Hook:
 
+    # all the stages that a runner may trigger through ``call_hook()``
+    stages = ('before_run', 'before_epoch', 'before_train_epoch',
+              'before_val_epoch', 'before_iter', 'before_train_iter',
+              'before_val_iter', 'after_iter', 'after_train_iter',
+              'after_val_iter', 'after_epoch', 'after_train_epoch',
+              'after_val_epoch', 'after_run')
+    # hooks that are only useful in the main process (rank 0), they are not
+    # registered in the other processes of distributed training
+    main_only = False
+
     def before_run(self, runner):
         pass
 
@@ -59,3 +69,30 @@ class Hook:
 
     def end_of_epoch(self, runner):
         return runner.inner_iter + 1 == len(runner.data_loader)
+
+    def get_triggered_stages(self):
+        """Get the stages in which this hook actually does something.
+
+        A stage is triggered if its method is overridden, or if it falls back
+        to an overridden generic method, e.g. ``before_train_epoch`` calls
+        ``before_epoch`` by default.
+
+        Returns:
+            list[str]: Triggered stages, in the order of :attr:`stages`.
+        """
+        trigger_stages = set()
+        for stage in Hook.stages:
+            if is_method_overridden(stage, Hook, self):
+                trigger_stages.add(stage)
+
+        method_stages_map = {
+            'before_epoch': ['before_train_epoch', 'before_val_epoch'],
+            'after_epoch': ['after_train_epoch', 'after_val_epoch'],
+            'before_iter': ['before_train_iter', 'before_val_iter'],
+            'after_iter': ['after_train_iter', 'after_val_iter'],
+        }
+        for method, map_stages in method_stages_map.items():
+            if is_method_overridden(method, Hook, self):
+                trigger_stages.update(map_stages)
+
+        return [stage for stage in Hook.stages if stage in trigger_stages]
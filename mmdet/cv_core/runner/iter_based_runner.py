@@ -1,8 +1,6 @@
 # Copyright (c) Open-MMLab. All rights reserved.
 import os.path as osp
 import time
-import platform
-import shutil
 import warnings
 import torch
 from torch.optim import Optimizer
@@ -10,7 +8,6 @@ from torch.optim import Optimizer
 from mmdet import cv_core
 from .builder import RUNNERS
 from .base_runner import BaseRunner
-from .checkpoint import save_checkpoint
 from .hooks import IterTimerHook
 from .utils import get_host_info
 
@@ -107,6 +104,7 @@ class IterBasedRunner(BaseRunner):
         self.logger.info('Start running, host: %s, work_dir: %s',
                          get_host_info(), work_dir)
         self.logger.info('workflow: %s, max: %d iters', workflow, self._max_iters)
+        self.freeze_hooks()
         self.call_hook('before_run')
 
         iter_loaders = [IterLoader(x) for x in data_loaders]
@@ -129,6 +127,7 @@ class IterBasedRunner(BaseRunner):
 
         time.sleep(1)  # wait for some hooks like loggers to finish
         self.call_hook('after_epoch')
+        self.wait_for_checkpoint(shutdown=True)
         self.call_hook('after_run')
 
     def resume(self,
@@ -175,7 +174,8 @@ class IterBasedRunner(BaseRunner):
                         filename_tmpl='iter_{}.pth',
                         meta=None,
                         save_optimizer=True,
-                        create_symlink=True):
+                        create_symlink=True,
+                        async_save=False):
         """Save checkpoint to file.
 
         Args:
@@ -188,6 +188,8 @@ class IterBasedRunner(BaseRunner):
                 Defaults to True.
             create_symlink (bool, optional): Whether create symlink to the
                 latest checkpoint file. Defaults to True.
+            async_save (bool, optional): Whether to write the checkpoint file
+                in a background thread. Defaults to False.
         """
         if meta is None:
             meta = dict(iter=self.iter + 1, epoch=self.epoch + 1)
@@ -202,15 +204,12 @@ class IterBasedRunner(BaseRunner):
         filename = filename_tmpl.format(self.iter + 1)
         filepath = osp.join(out_dir, filename)
         optimizer = self.optimizer if save_optimizer else None
-        save_checkpoint(self.model, filepath, optimizer=optimizer, meta=meta)
-        # in some environments, `os.symlink` is not supported, you may need to
-        # set `create_symlink` to False
-        if create_symlink:
-            dst_file = osp.join(out_dir, 'latest.pth')
-            if platform.system() != 'Windows':
-                cv_core.symlink(filename, dst_file)
-            else:
-                shutil.copy(filename, dst_file)
+        self._save_checkpoint(
+            filepath,
+            optimizer=optimizer,
+            meta=meta,
+            create_symlink=create_symlink,
+            async_save=async_save)
 
     def register_training_hooks(self,
                                 lr_config,
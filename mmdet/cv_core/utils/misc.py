@@ -317,6 +317,28 @@ def deprecated_api_warning(name_dict, cls_name=None):
     return api_warning_wrapper
 
 
+def is_method_overridden(method, base_class, derived_class):
+    """Check if a method of base class is overridden in derived class.
+
+    Args:
+        method (str): the method name to check.
+        base_class (type): the class of the base class.
+        derived_class (type | Any): the class or instance of the derived class.
+
+    Returns:
+        bool: Whether ``method`` is overridden.
+    """
+    assert isinstance(base_class, type), \
+        "base_class doesn't accept instance, Please pass class instead."
+
+    if not isinstance(derived_class, type):
+        derived_class = derived_class.__class__
+
+    base_method = getattr(base_class, method)
+    derived_method = getattr(derived_class, method)
+    return derived_method != base_method
+
+
 
 class Linear(nn.Module):
     """An identity activation function"""
@@ -0,0 +1,150 @@
+# Copyright (c) Open-MMLab. All rights reserved.
+import logging
+import os.path as osp
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, TensorDataset
+
+from mmdet.cv_core.runner import CheckpointHook, IterBasedRunner, OptimizerHook
+
+
+class Model(nn.Module):
+
+    def __init__(self):
+        super().__init__()
+        self.linear = nn.Linear(2, 1)
+
+    def train_step(self, data_batch, optimizer, **kwargs):
+        x = data_batch[0]
+        loss = self.linear(x).sum()
+        return dict(
+            loss=loss, log_vars=dict(loss=loss.item()), num_samples=len(x))
+
+    def val_step(self, data_batch, optimizer=None, **kwargs):
+        return self.train_step(data_batch, optimizer)
+
+
+def _build_runner(work_dir, max_iters=2):
+    model = Model()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+    return IterBasedRunner(
+        model,
+        optimizer=optimizer,
+        work_dir=work_dir,
+        logger=logging.getLogger('test_async_checkpoint'),
+        max_iters=max_iters)
+
+
+def _train_step(runner):
+    loss = runner.model.linear(torch.ones(2, 2)).sum()
+    runner.optimizer.zero_grad()
+    loss.backward()
+    runner.optimizer.step()
+
+
+def test_async_checkpoint_hook():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runner = _build_runner(tmpdir)
+        runner.register_hook(OptimizerHook())
+        runner.register_hook(
+            CheckpointHook(interval=1, by_epoch=False, async_save=True))
+        loader = DataLoader(TensorDataset(torch.ones(4, 2)), batch_size=2)
+        runner.run([loader], [('train', 1)])
+
+        assert runner._ckpt_executor is None
+        assert osp.isfile(osp.join(tmpdir, 'iter_1.pth'))
+        latest = osp.join(tmpdir, 'latest.pth')
+        assert osp.realpath(latest) == osp.realpath(
+            osp.join(tmpdir, 'iter_2.pth'))
+        checkpoint = torch.load(latest)
+        assert checkpoint['meta']['iter'] == 2
+        for key, val in runner.model.state_dict().items():
+            assert torch.equal(checkpoint['state_dict'][key], val)
+        assert 'momentum_buffer' in checkpoint['optimizer']['state'][0]
+
+
+def test_async_checkpoint_snapshot():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runner = _build_runner(tmpdir)
+        _train_step(runner)
+        weight = runner.model.linear.weight.detach().clone()
+        momentum = runner.optimizer.state_dict()['state'][0][
+            'momentum_buffer'].clone()
+
+        # keep the writer busy so that the file is written after the step
+        release = threading.Event()
+        runner._ckpt_executor = ThreadPoolExecutor(max_workers=1)
+        runner._ckpt_executor.submit(release.wait)
+        runner.save_checkpoint(tmpdir, async_save=True)
+        _train_step(runner)
+        latest = osp.join(tmpdir, 'latest.pth')
+        assert not osp.lexists(latest)
+
+        release.set()
+        runner.wait_for_checkpoint(shutdown=True)
+        checkpoint = torch.load(latest)
+        assert torch.equal(checkpoint['state_dict']['linear.weight'], weight)
+        assert not torch.equal(runner.model.linear.weight.detach(), weight)
+        assert torch.equal(
+            checkpoint['optimizer']['state'][0]['momentum_buffer'], momentum)
+
+        # the staging buffers are reused by the next saving
+        buffer = runner._ckpt_buffers['linear.weight']
+        runner.save_checkpoint(tmpdir, async_save=True)
+        runner.wait_for_checkpoint(shutdown=True)
+        assert runner._ckpt_buffers['linear.weight'] is buffer
+
+
+def test_async_checkpoint_error(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runner = _build_runner(tmpdir)
+
+        def _raise(*args, **kwargs):
+            raise IOError('disk full')
+
+        monkeypatch.setattr(torch, 'save', _raise)
+        runner.save_checkpoint(tmpdir, async_save=True)
+        with pytest.raises(IOError, match='disk full'):
+            runner.wait_for_checkpoint(shutdown=True)
+        assert runner._ckpt_executor is None
+        assert not osp.lexists(osp.join(tmpdir, 'latest.pth'))
+        # the error is only raised once
+        runner.wait_for_checkpoint()
+
+
+
+def test_async_checkpoint_max_keep_ckpts(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runner = _build_runner(tmpdir)
+        hook = CheckpointHook(
+            interval=1, by_epoch=False, max_keep_ckpts=1, async_save=True)
+        latest = osp.join(tmpdir, 'latest.pth')
+
+        for i in range(2):
+            runner._iter = i
+            hook.after_train_iter(runner)
+            runner.wait_for_checkpoint()
+        assert not osp.exists(osp.join(tmpdir, 'iter_1.pth'))
+        assert osp.realpath(latest) == osp.realpath(
+            osp.join(tmpdir, 'iter_2.pth'))
+
+        def _raise(*args, **kwargs):
+            raise IOError('disk full')
+
+        # the previous checkpoint is kept if the new one fails to be written
+        monkeypatch.setattr(torch, 'save', _raise)
+        runner._iter = 2
+        hook.after_train_iter(runner)
+        with pytest.raises(IOError, match='disk full'):
+            runner.wait_for_checkpoint(shutdown=True)
+        assert osp.isfile(osp.join(tmpdir, 'iter_2.pth'))
+        assert osp.realpath(latest) == osp.realpath(
+            osp.join(tmpdir, 'iter_2.pth'))
+        monkeypatch.undo()
+        checkpoint = torch.load(latest)
+        assert checkpoint['meta']['iter'] == 2
@@ -0,0 +1,101 @@
+# Copyright (c) Open-MMLab. All rights reserved.
+import logging
+
+import torch.nn as nn
+
+from mmdet.cv_core.runner import Hook, IterBasedRunner
+
+
+class Model(nn.Module):
+
+    def __init__(self):
+        super().__init__()
+        self.linear = nn.Linear(2, 1)
+
+    def train_step(self, data_batch, optimizer, **kwargs):
+        pass
+
+
+class RecordHook(Hook):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def after_train_iter(self, runner):
+        self.calls.append((self.name, 'after_train_iter'))
+
+
+class EpochHook(Hook):
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def before_epoch(self, runner):
+        self.calls.append('before_epoch')
+
+
+class CustomStageHook(Hook):
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def custom_stage(self, runner):
+        self.calls.append('custom_stage')
+
+
+def _build_runner():
+    return IterBasedRunner(
+        Model(), logger=logging.getLogger('test_hook_dispatch'))
+
+
+def test_priority_order():
+    calls = []
+    runner = _build_runner()
+    runner.register_hook(RecordHook('a', calls))
+    runner.register_hook(RecordHook('b', calls), priority='LOW')
+    runner.register_hook(RecordHook('c', calls))
+    runner.register_hook(RecordHook('d', calls), priority='HIGH')
+    runner.call_hook('after_train_iter')
+    assert [name for name, _ in calls] == ['d', 'a', 'c', 'b']
+    assert [hook.name for hook in runner.hooks] == ['d', 'a', 'c', 'b']
+    # hooks that do not override a stage are not called
+    runner.call_hook('before_train_iter')
+    assert len(calls) == 4
+
+
+def test_generic_stage_fallback():
+    calls = []
+    runner = _build_runner()
+    hook = EpochHook(calls)
+    assert hook.get_triggered_stages() == [
+        'before_epoch', 'before_train_epoch', 'before_val_epoch'
+    ]
+    runner.register_hook(hook)
+    for stage in ['before_train_epoch', 'before_val_epoch', 'before_epoch']:
+        runner.call_hook(stage)
+    assert calls == ['before_epoch'] * 3
+    runner.call_hook('after_train_epoch')
+    assert len(calls) == 3
+
+
+def test_register_after_freeze():
+    calls = []
+    runner = _build_runner()
+    runner.register_hook(RecordHook('a', calls))
+    runner.freeze_hooks()
+    runner.register_hook(RecordHook('b', calls), priority='HIGH')
+    runner.call_hook('after_train_iter')
+    assert [name for name, _ in calls] == ['b', 'a']
+    runner.freeze_hooks()
+    runner.call_hook('after_train_iter')
+    assert [name for name, _ in calls] == ['b', 'a', 'b', 'a']
+
+
+def test_unknown_stage():
+    calls = []
+    runner = _build_runner()
+    runner.register_hook(CustomStageHook(calls))
+    assert 'custom_stage' not in Hook.stages
+    runner.call_hook('custom_stage')
+    assert calls == ['custom_stage']